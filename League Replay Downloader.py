@@ -1,128 +1,208 @@
+import base64
+import json
+import logging
 import os
+import random
+import re
 import sys
 import requests
-import psutil
-from PyQt5 import QtWidgets, QtCore, QtGui
+from PyQt5 import QtWidgets, QtCore, QtGui, QtNetwork
+try:
+    from PyQt5 import QtWebSockets
+except ImportError:  # some distro builds package QtWebSockets separately
+    QtWebSockets = None
 import subprocess
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import time
 
-def connect_to_lcu():
+requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
+
+log = logging.getLogger(__name__)
+
+# Connection details stay valid for the client's lifetime; requests rescan only when they fail.
+_LCU_CACHE = {'data': None, 'install_dir': None}
+_LCU_TIMEOUT = 5
+_LCU_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+_LCU_ARGS = frozenset(('--app-port', '--remoting-auth-token', '--install-directory'))
+_LCU_PROCESS_NAMES = frozenset(('LeagueClientUx.exe', 'LeagueClientUx'))
+_LOCKFILE_DIRS = [
+    r"C:\Riot Games\League of Legends",
+    "/Applications/League of Legends.app/Contents/LoL",
+]
+
+# One keep-alive session for every LCU call, so the TLS handshake happens once per client run.
+_SESSION = requests.Session()
+_SESSION.verify = False
+_SESSION.headers['Content-Type'] = 'application/json'
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Runs speculative LCU lookups alongside the request that may need them.
+_LCU_POOL = ThreadPoolExecutor(max_workers=2)
+
+_REPLAY_DIR = os.path.join(os.path.expanduser("~"), "Documents", "League of Legends", "Replays")
+# "<platform>-<game id>.rofl", e.g. "EUW1-1234567890.rofl"
+_REPLAY_NAME_RE = re.compile(r'[^-]*-(\d+)\.rofl')
+
+def _read_lcu_lockfile():
+    """Return (port, auth_token) from the League Client lockfile, or None if there is none."""
+    install_dir = _LCU_CACHE['install_dir']
+    for lockfile_dir in ([install_dir] if install_dir else []) + _LOCKFILE_DIRS:
+        try:
+            with open(os.path.join(lockfile_dir, 'lockfile')) as f:
+                # LeagueClient:<pid>:<port>:<password>:<protocol>
+                parts = f.read().strip().split(':')
+        except OSError:
+            continue
+        if len(parts) == 5:
+            return parts[2], parts[3]
+    return None
+
+def _iter_lcu_cmdlines():
+    """Yield the command line of each running LeagueClientUx process."""
+    import psutil  # deferred: loading psutil noticeably delays the first window
+
+    for proc in psutil.process_iter(['pid', 'name']):
+        if proc.info['name'] in _LCU_PROCESS_NAMES:
+            try:
+                yield proc.cmdline()
+            except psutil.Error:
+                continue
+
+def _cache_lcu_data(port, auth_token):
+    """Store the connection details and point the shared session at them."""
+    auth_header = 'Basic ' + base64.b64encode(f'riot:{auth_token}'.encode()).decode()
+    _LCU_CACHE['data'] = {
+        'port': port,
+        'auth_token': auth_token,
+        'base_url': f"https://127.0.0.1:{port}",
+        'auth_header': auth_header,
+    }
+    _SESSION.headers['Authorization'] = auth_header
+    return _LCU_CACHE['data']
+
+def connect_to_lcu(refresh=False):
     """Connect to the League Client and get port and auth token."""
-    for proc in psutil.process_iter(['name', 'cmdline']):
-        proc_name = proc.info['name']
-        if proc_name in ['LeagueClientUx.exe', 'LeagueClientUx']:
-            cmdline = proc.info['cmdline']
-            port = None
-            auth_token = None
-            for arg in cmdline:
-                if arg.startswith('--app-port='):
-                    port = arg.split('=')[1]
-                elif arg.startswith('--remoting-auth-token='):
-                    auth_token = arg.split('=')[1]
-            if port and auth_token:
-                return {'port': port, 'auth_token': auth_token}
+    if not refresh and _LCU_CACHE['data']:
+        return _LCU_CACHE['data']
+
+    _LCU_CACHE['data'] = None
+    # A refresh means the last credentials failed, which may be a stale lockfile left by a crash.
+    if not refresh:
+        lockfile = _read_lcu_lockfile()
+        if lockfile:
+            return _cache_lcu_data(*lockfile)
+
+    for cmdline in _iter_lcu_cmdlines():
+        found = {}
+        for arg in cmdline:
+            key, sep, value = arg.partition('=')
+            if sep and key in _LCU_ARGS:
+                found[key] = value
+                if len(found) == len(_LCU_ARGS):
+                    break
+        port = found.get('--app-port')
+        auth_token = found.get('--remoting-auth-token')
+        if port and auth_token:
+            _LCU_CACHE['install_dir'] = found.get('--install-directory')
+            return _cache_lcu_data(port, auth_token)
     return None
 
+def _lcu_send(method, lcu_data, path, **kwargs):
+    """Send a request to the League Client, rescanning once if the cached connection is stale."""
+    for attempt in range(2):
+        try:
+            response = _SESSION.request(method, lcu_data['base_url'] + path, timeout=_LCU_TIMEOUT, **kwargs)
+        except _LCU_ERRORS:
+            if attempt:
+                raise
+        else:
+            if response.status_code != 401 or attempt:
+                return response
+        lcu_data = connect_to_lcu(refresh=True)
+        if not lcu_data:
+            raise requests.exceptions.ConnectionError("LeagueClient not found.")
+
+def _lcu_get(lcu_data, path):
+    """GET from the League Client over the shared session."""
+    return _lcu_send('GET', lcu_data, path)
+
+def _lcu_post(lcu_data, path, json=None):
+    """POST to the League Client over the shared session."""
+    return _lcu_send('POST', lcu_data, path, json={} if json is None else json)
+
 def list_available_replays(recently_downloaded):
     """Get a list of replay files sorted by date."""
     replay_dir = get_replay_directory()
 
-    if not os.path.exists(replay_dir):
+    try:
+        with os.scandir(replay_dir) as it:
+            rofl_entries = [(e.name, e.stat().st_mtime) for e in it if e.name.endswith('.rofl')]
+    except FileNotFoundError:
         return None, f"Replay directory not found: {replay_dir}"
 
-    rofl_files = [f for f in os.listdir(replay_dir) if f.endswith('.rofl')]
-
-    if not rofl_files:
+    if not rofl_entries:
         return None, "No replays found."
 
     replay_ids = []
-    for file in rofl_files:
-        filepath = os.path.join(replay_dir, file)
-        filename = os.path.splitext(file)[0]
-        parts = filename.split('-')
-        if len(parts) == 2 and parts[1].isdigit():
-            game_id = parts[1]
-            is_recent = game_id in recently_downloaded
-            mod_time = os.path.getmtime(filepath)
-            replay_ids.append((game_id, is_recent, mod_time))
+    for name, mod_time in rofl_entries:
+        match = _REPLAY_NAME_RE.fullmatch(name)
+        if match:
+            game_id = match.group(1)
+            formatted_date = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mod_time))
+            replay_ids.append((game_id, game_id in recently_downloaded, mod_time, formatted_date))
 
     if not replay_ids:
         return None, "No valid replays available."
 
-    replay_ids.sort(key=lambda x: x[2], reverse=True)
+    replay_ids.sort(key=itemgetter(2), reverse=True)
 
     return replay_ids, None
 
-def download_replay_api(game_id):
-    """Download a replay using the API."""
-    lcu_data = connect_to_lcu()
+def _rofl_request(game_id, action, success_codes, success_message, lcu_data=None):
+    """POST a replay action to the League Client and return (success, message)."""
+    lcu_data = lcu_data or connect_to_lcu()
 
     if not lcu_data:
-        return {'success': False, 'message': "LeagueClient not found. Ensure it's running and try again.", 'game_id': game_id}
-
-    url = f"https://127.0.0.1:{lcu_data['port']}/lol-replays/v1/rofls/{game_id}/download"
-    auth = requests.auth.HTTPBasicAuth('riot', lcu_data['auth_token'])
-
-    requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
-
-    headers = {'Content-Type': 'application/json'}
+        return False, "LeagueClient not found. Ensure it's running and try again."
 
     try:
-        response = requests.post(url, auth=auth, json={}, headers=headers, verify=False)
-    except requests.exceptions.ConnectionError:
-        return {'success': False, 'message': "Connection failed. Make sure LeagueClient is running.", 'game_id': game_id}
+        response = _lcu_post(lcu_data, f"/lol-replays/v1/rofls/{game_id}/{action}")
+    except _LCU_ERRORS:
+        return False, "Connection failed. Make sure LeagueClient is running."
 
-    if response.status_code in [201, 204]:
-        return {'success': True, 'message': "Download started!", 'game_id': game_id}
+    if response.status_code in success_codes:
+        return True, success_message
     elif response.status_code == 404:
-        return {'success': False, 'message': f"Game ID {game_id} not found or replay unavailable.", 'game_id': game_id}
+        return False, f"Game ID {game_id} not found or replay unavailable."
     else:
-        return {'success': False, 'message': f"Error {response.status_code}: {response.text}", 'game_id': game_id}
-
-def play_replay_api(game_id):
-    """Play a replay using the API."""
-    lcu_data = connect_to_lcu()
+        return False, f"Error {response.status_code}: {response.text}"
 
-    if not lcu_data:
-        return "LeagueClient not found. Ensure it's running and try again."
-
-    url = f"https://127.0.0.1:{lcu_data['port']}/lol-replays/v1/rofls/{game_id}/watch"
-    auth = requests.auth.HTTPBasicAuth('riot', lcu_data['auth_token'])
-
-    requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
-
-    headers = {'Content-Type': 'application/json'}
-
-    try:
-        response = requests.post(url, auth=auth, json={}, headers=headers, verify=False)
-    except requests.exceptions.ConnectionError:
-        return "Connection failed. Make sure LeagueClient is running."
+def download_replay_api(game_id):
+    """Download a replay using the API."""
+    success, message = _rofl_request(game_id, 'download', (201, 204), "Download started!")
+    return {'success': success, 'message': message, 'game_id': game_id}
 
-    if response.status_code in [200, 204]:
-        return "Replay playback started!"
-    elif response.status_code == 404:
-        return f"Game ID {game_id} not found or replay unavailable."
-    else:
-        return f"Error {response.status_code}: {response.text}"
+def play_replay_api(game_id, lcu_data=None):
+    """Play a replay using the API."""
+    return _rofl_request(game_id, 'watch', (200, 204), "Replay playback started!", lcu_data)[1]
 
 def get_replay_directory():
     """Return the default replay directory path."""
-    home_dir = os.path.expanduser("~")
-    return os.path.join(home_dir, "Documents", "League of Legends", "Replays")
+    return _REPLAY_DIR
 
 def launch_replay():
     """Open the latest replay file with the default application."""
     replay_dir = get_replay_directory()
-    if not os.path.exists(replay_dir):
+    try:
+        with os.scandir(replay_dir) as it:
+            rofl_entries = [(e.name, e.stat().st_mtime) for e in it if e.name.endswith('.rofl')]
+    except FileNotFoundError:
         return f"Replay directory not found: {replay_dir}"
-
-    rofl_files = [f for f in os.listdir(replay_dir) if f.endswith('.rofl')]
-    if not rofl_files:
+    if not rofl_entries:
         return "No replay files found."
 
-    rofl_files.sort(key=lambda x: os.path.getmtime(os.path.join(replay_dir, x)), reverse=True)
-    latest_replay = rofl_files[0]
+    latest_replay = max(rofl_entries, key=itemgetter(1))[0]
     replay_path = os.path.join(replay_dir, latest_replay)
 
     try:
@@ -136,20 +216,15 @@ def launch_replay():
     except Exception as e:
         return f"Failed to launch replay: {e}"
 
-def get_game_details(game_id):
+def get_game_details(game_id, lcu_data=None):
     """Get game details for metadata creation."""
-    lcu_data = connect_to_lcu()
+    lcu_data = lcu_data or connect_to_lcu()
     if not lcu_data:
-        print("LeagueClient not found. Cannot get game details.")
+        log.warning("LeagueClient not found. Cannot get game details.")
         return None
 
-    url = f"https://127.0.0.1:{lcu_data['port']}/lol-match-history/v1/games/{game_id}"
-    auth = requests.auth.HTTPBasicAuth('riot', lcu_data['auth_token'])
-
-    requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
-
     try:
-        response = requests.get(url, auth=auth, verify=False)
+        response = _lcu_get(lcu_data, f"/lol-match-history/v1/games/{game_id}")
         if response.status_code == 200:
             game_info = response.json()
             game_version = game_info.get('gameVersion')
@@ -161,7 +236,7 @@ def get_game_details(game_id):
             if game_creation and game_duration:
                 game_end = game_creation + (game_duration * 1000)
             else:
-                print(f"Missing gameCreation or gameDuration for game {game_id}.")
+                log.warning("Missing gameCreation or gameDuration for game %s.", game_id)
                 return None
 
             if all([game_version, game_type, queue_id, game_end]):
@@ -172,64 +247,70 @@ def get_game_details(game_id):
                     "gameEnd": game_end
                 }
             else:
-                print(f"Missing game details for game {game_id}.")
+                log.warning("Missing game details for game %s.", game_id)
                 return None
         else:
-            print(f"Failed to get game details for game {game_id}: {response.status_code} - {response.text}")
+            log.warning("Failed to get game details for game %s: %s - %s", game_id, response.status_code, response.text)
             return None
-    except requests.exceptions.ConnectionError:
-        print("Failed to connect to LeagueClient for game details.")
+    except _LCU_ERRORS:
+        log.warning("Failed to connect to LeagueClient for game details.")
         return None
 
-def get_replay_metadata(game_id):
-    """Fetch replay metadata from the API."""
-    lcu_data = connect_to_lcu()
+def get_replay_metadata(game_id, prefetch_details=False, lcu_data=None):
+    """Fetch replay metadata from the API, optionally fetching game details in parallel."""
+    lcu_data = lcu_data or connect_to_lcu()
 
     if not lcu_data:
-        print("LeagueClient not found. Cannot get metadata.")
+        log.warning("LeagueClient not found. Cannot get metadata.")
         return None
 
-    url = f"https://127.0.0.1:{lcu_data['port']}/lol-replays/v1/metadata/{game_id}"
-    auth = requests.auth.HTTPBasicAuth('riot', lcu_data['auth_token'])
-
-    requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
+    metadata_path = f"/lol-replays/v1/metadata/{game_id}"
+    details_future = _LCU_POOL.submit(get_game_details, game_id, lcu_data) if prefetch_details else None
 
     try:
-        response = requests.get(url, auth=auth, verify=False)
+        response = _lcu_get(lcu_data, metadata_path)
         if response.status_code == 200:
             metadata = response.json()
-            print(f"Metadata for game {game_id}: {metadata}")
+            log.debug("Metadata for game %s: %s", game_id, metadata)
             return metadata
         elif response.status_code == 404:
-            print(f"Metadata for game {game_id} not found. Trying to create it.")
-            game_details = get_game_details(game_id)
+            log.debug("Metadata for game %s not found. Trying to create it.", game_id)
+            game_details = details_future.result() if details_future else get_game_details(game_id, lcu_data)
             if not game_details:
-                print(f"Cannot create metadata without game details for game {game_id}.")
+                log.warning("Cannot create metadata without game details for game %s.", game_id)
                 return None
-            create_url = f"https://127.0.0.1:{lcu_data['port']}/lol-replays/v2/metadata/{game_id}/create"
-            create_response = requests.post(create_url, auth=auth, json=game_details, verify=False)
+            create_response = _lcu_post(lcu_data, f"/lol-replays/v2/metadata/{game_id}/create", json=game_details)
             if create_response.status_code in [200, 201, 204]:
-                print(f"Metadata creation requested for game {game_id}. Fetching again.")
-                retry_response = requests.get(url, auth=auth, verify=False)
+                log.debug("Metadata creation requested for game %s. Fetching again.", game_id)
+                retry_response = _lcu_get(lcu_data, metadata_path)
                 if retry_response.status_code == 200:
                     metadata = retry_response.json()
-                    print(f"Metadata for game {game_id}: {metadata}")
+                    log.debug("Metadata for game %s: %s", game_id, metadata)
                     return metadata
                 else:
-                    print(f"Failed to fetch metadata after creation for game {game_id}: {retry_response.status_code} - {retry_response.text}")
+                    log.warning("Failed to fetch metadata after creation for game %s: %s - %s", game_id, retry_response.status_code, retry_response.text)
                     return None
             else:
-                print(f"Failed to create metadata for game {game_id}: {create_response.status_code} - {create_response.text}")
+                log.warning("Failed to create metadata for game %s: %s - %s", game_id, create_response.status_code, create_response.text)
                 return None
         else:
-            print(f"Failed to get metadata for game {game_id}: {response.status_code} - {response.text}")
+            log.warning("Failed to get metadata for game %s: %s - %s", game_id, response.status_code, response.text)
             return None
-    except requests.exceptions.ConnectionError:
-        print("Failed to connect to LeagueClient for metadata.")
+    except _LCU_ERRORS:
+        log.warning("Failed to connect to LeagueClient for metadata.")
         return None
 
 def create_question_mark_icon(color="#FFFFFF", size=16):
     """Generate a simple question mark icon."""
+    key = f"question_mark:{color}:{size}"
+    pixmap = QtGui.QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = _render_question_mark(color, size)
+        QtGui.QPixmapCache.insert(key, pixmap)
+    return QtGui.QIcon(pixmap)
+
+def _render_question_mark(color, size):
+    """Draw the question mark glyph onto a transparent pixmap."""
     pixmap = QtGui.QPixmap(size, size)
     pixmap.fill(QtCore.Qt.transparent)
 
@@ -249,60 +330,96 @@ def create_question_mark_icon(color="#FFFFFF", size=16):
 
     painter.end()
 
-    icon = QtGui.QIcon(pixmap)
-    return icon
+    return pixmap
+
+class ReplayTableModel(QtCore.QAbstractTableModel):
+    """Model serving replay tuples to the replay table."""
+    HEADERS = ["Game ID", "Downloaded", "Date"]
+    ALIGNMENTS = (
+        int(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter),
+        int(QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter),
+        int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter),
+    )
+    _GREEN_BRUSH = QtGui.QBrush(QtGui.QColor("green"))
+    _WHITE_BRUSH = QtGui.QBrush(QtGui.QColor("white"))
+    # Indexed by is_recent.
+    _RECENT_TEXT = ("No", "Yes")
+    _RECENT_BRUSHES = (_WHITE_BRUSH, _GREEN_BRUSH)
+
+    def __init__(self, replay_list, parent=None):
+        super().__init__(parent)
+        self.replay_list = replay_list
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.replay_list)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """Return the text, alignment and color for a cell; UserRole holds the row's game ID."""
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        game_id, is_recent, _, formatted_date = self.replay_list[row]
+
+        if role == QtCore.Qt.DisplayRole:
+            if column == 0:
+                return game_id
+            if column == 1:
+                return self._RECENT_TEXT[is_recent]
+            return formatted_date
+        if role == QtCore.Qt.TextAlignmentRole:
+            return self.ALIGNMENTS[column]
+        if role == QtCore.Qt.ForegroundRole and column == 1:
+            return self._RECENT_BRUSHES[is_recent]
+        if role == QtCore.Qt.UserRole:
+            return game_id
+        return None
 
-class CustomTableWidget(QtWidgets.QTableWidget):
+    def set_replays(self, replay_list):
+        """Swap in a new replay listing."""
+        self.beginResetModel()
+        self.replay_list = replay_list
+        self.endResetModel()
+
+_TABLE_QSS = """
+    QTableView {
+        background-color: #2e3440;
+        color: #d8dee9;
+        border: none;
+    }
+    QHeaderView::section {
+        background-color: #3b4252;
+        color: #d8dee9;
+        font-weight: bold;
+        padding: 4px;
+        border: 1px solid #4c566a;
+    }
+    QTableView::item {
+        padding: 8px;
+        border-bottom: 1px solid #4c566a;
+    }
+    QTableView::item:selected {
+        background-color: #5e81ac;
+        color: #d8dee9;
+    }
+"""
+
+class CustomTableView(QtWidgets.QTableView):
     """Table to show replays."""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setColumnCount(3)
-        self.setHorizontalHeaderLabels(["Game ID", "Downloaded", "Date"])
         self.horizontalHeader().setStretchLastSection(True)
         self.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
         self.verticalHeader().setVisible(False)
         self.setShowGrid(True)
-        self.setStyleSheet("""
-            QTableWidget {
-                background-color: #2e3440;
-                color: #d8dee9;
-                border: none;
-            }
-            QHeaderView::section {
-                background-color: #3b4252;
-                color: #d8dee9;
-                font-weight: bold;
-                padding: 4px;
-                border: 1px solid #4c566a;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #4c566a;
-            }
-            QTableWidget::item:selected {
-                background-color: #5e81ac;
-                color: #d8dee9;
-            }
-        """)
-
-    def populate_table(self, replay_list):
-        """Fill the table with replay information."""
-        self.setRowCount(len(replay_list))
-        for row, (game_id, is_recent, mod_time) in enumerate(replay_list):
-            game_id_item = QtWidgets.QTableWidgetItem(f"Game ID: {game_id}")
-            game_id_item.setTextAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-            self.setItem(row, 0, game_id_item)
-
-            recent_item = QtWidgets.QTableWidgetItem("Yes" if is_recent else "No")
-            recent_item.setTextAlignment(QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter)
-            color = QtGui.QColor("green") if is_recent else QtGui.QColor("white")
-            recent_item.setForeground(QtGui.QBrush(color))
-            self.setItem(row, 1, recent_item)
-
-            formatted_date = datetime.fromtimestamp(mod_time).strftime('%Y-%m-%d %H:%M:%S')
-            date_item = QtWidgets.QTableWidgetItem(formatted_date)
-            date_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-            self.setItem(row, 2, date_item)
+        self.setStyleSheet(_TABLE_QSS)
 
 class ReplaysListDialog(QtWidgets.QDialog):
     """Dialog to display available replays."""
@@ -313,66 +430,30 @@ class ReplaysListDialog(QtWidgets.QDialog):
         self.resize(720, 500)
 
         layout = QtWidgets.QVBoxLayout()
-        self.table_widget = CustomTableWidget()
+        self.table_view = CustomTableView()
 
-        self.table_widget.populate_table(replay_list)
-        self.table_widget.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.table_widget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        self.table_widget.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.model = ReplayTableModel(replay_list, self)
+        self.table_view.setModel(self.model)
+        self.table_view.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table_view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table_view.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
 
-        self.table_widget.cellDoubleClicked.connect(self.cell_double_clicked)
+        self.table_view.doubleClicked.connect(self.row_double_clicked)
 
-        layout.addWidget(self.table_widget)
+        layout.addWidget(self.table_view)
         self.setLayout(layout)
 
-    def cell_double_clicked(self, row, column):
+    def set_replays(self, replay_list):
+        """Show a new replay listing in the existing table."""
+        self.model.set_replays(replay_list)
+        self.table_view.scrollToTop()
+
+    def row_double_clicked(self, index):
         """Set the selected Game ID and close the dialog."""
-        game_id_item = self.table_widget.item(row, 0)
-        if game_id_item:
-            game_id = game_id_item.text().split(': ')[1]
-            self.game_id_entry.setText(game_id)
+        if index.isValid():
+            self.game_id_entry.setText(index.data(QtCore.Qt.UserRole))
             self.close()
 
-class ResizeHandle(QtWidgets.QWidget):
-    """Handle to resize the window."""
-    def __init__(self, parent, handle_type):
-        super().__init__(parent)
-        self.handle_type = handle_type
-        self.setFixedSize(10, 10)
-        self.setStyleSheet("background-color: #4c566a;")
-        self.setCursor(QtCore.Qt.SizeAllCursor)
-
-    def mousePressEvent(self, event):
-        """Store initial mouse position and window size."""
-        self.start_x = event.globalX()
-        self.start_y = event.globalY()
-        self.start_width = self.parent().width()
-        self.start_height = self.parent().height()
-        super().mousePressEvent(event)
-
-    def mouseMoveEvent(self, event):
-        """Resize the window based on mouse movement."""
-        delta_x = event.globalX() - self.start_x
-        delta_y = event.globalY() - self.start_y
-        parent = self.parent()
-        if self.handle_type == 'bottom_right':
-            new_width = self.start_width + delta_x
-            new_height = self.start_height + delta_y
-            parent.resize(new_width, new_height)
-        elif self.handle_type == 'bottom_left':
-            new_width = self.start_width - delta_x
-            new_height = self.start_height + delta_y
-            parent.setGeometry(parent.x() + delta_x, parent.y(), new_width, new_height)
-        elif self.handle_type == 'top_right':
-            new_width = self.start_width + delta_x
-            new_height = self.start_height - delta_y
-            parent.setGeometry(parent.x(), parent.y() + delta_y, new_width, new_height)
-        elif self.handle_type == 'top_left':
-            new_width = self.start_width - delta_x
-            new_height = self.start_height - delta_y
-            parent.setGeometry(parent.x() + delta_x, parent.y() + delta_y, new_width, new_height)
-        super().mouseMoveEvent(event)
-
 class HelpDialog(QtWidgets.QDialog):
     """Dialog with helpful links."""
     def __init__(self, parent=None):
@@ -396,13 +477,63 @@ class HelpDialog(QtWidgets.QDialog):
 
         self.setLayout(layout)
 
+_APP_QSS = """
+    QWidget {
+        background-color: #2e3440;
+        color: #d8dee9;
+        font-family: 'Inter', Arial, sans-serif;
+    }
+    QPushButton {
+        padding: 8px;
+        border: 1px solid #4c566a;
+        border-radius: 4px;
+        background-color: #4c566a;
+        color: #d8dee9;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #5e81ac;
+    }
+    QLabel {
+        padding: 4px;
+        font-size: 12px;
+    }
+"""
+
+_LINEEDIT_QSS = """
+    QLineEdit {
+        padding: 8px;
+        border: 1px solid #4c566a;
+        border-radius: 4px;
+        background-color: #3b4252;
+        font-size: 12px;
+    }
+"""
+
+_TITLEBAR_QSS = "background-color: #3b4252;"
+
 class ReplayDownloaderApp(QtWidgets.QWidget):
     """Main application window."""
+    _CLOSE_ICON = None
+
     def __init__(self):
         super().__init__()
         self.init_ui()
         self.is_moving = False
-        self.recently_downloaded = []
+        self.recently_downloaded = set()
+
+        # Coalesce drag events so the window moves at most once per frame (~60 fps).
+        self.pending_pos = None
+        self.move_timer = QtCore.QTimer(self)
+        self.move_timer.setInterval(16)
+        self.move_timer.setSingleShot(True)
+        self.move_timer.timeout.connect(self.apply_pending_move)
+        self.download_worker = None
+        self.launch_worker = None
+        self.list_worker = None
+        self._replay_list_cache = None  # (cache_key, (replay_list, error_message))
+        self._replays_dialog = None
+        self._help_dialog = None
 
     def init_ui(self):
         self.setWindowTitle("League Replay Downloader")
@@ -412,7 +543,7 @@ class ReplayDownloaderApp(QtWidgets.QWidget):
         # Title bar
         self.title_bar = QtWidgets.QWidget(self)
         self.title_bar.setFixedHeight(30)
-        self.title_bar.setStyleSheet("background-color: #3b4252;")
+        self.title_bar.setStyleSheet(_TITLEBAR_QSS)
         title_layout = QtWidgets.QHBoxLayout()
         title_layout.setContentsMargins(10, 0, 10, 0)
 
@@ -421,8 +552,9 @@ class ReplayDownloaderApp(QtWidgets.QWidget):
 
         # Close button
         close_button = QtWidgets.QPushButton()
-        close_icon = self.style().standardIcon(QtWidgets.QStyle.SP_TitleBarCloseButton)
-        close_button.setIcon(close_icon)
+        if ReplayDownloaderApp._CLOSE_ICON is None:
+            ReplayDownloaderApp._CLOSE_ICON = self.style().standardIcon(QtWidgets.QStyle.SP_TitleBarCloseButton)
+        close_button.setIcon(ReplayDownloaderApp._CLOSE_ICON)
         close_button.setIconSize(QtCore.QSize(16, 16))
         close_button.setFixedSize(24, 24)
         close_button.setStyleSheet("background-color: transparent;")
@@ -452,15 +584,7 @@ class ReplayDownloaderApp(QtWidgets.QWidget):
         self.game_id_label = QtWidgets.QLabel("Enter Game ID:")
         self.game_id_label.setStyleSheet("font-size: 12px;")
         game_id_entry = QtWidgets.QLineEdit()
-        game_id_entry.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #4c566a;
-                border-radius: 4px;
-                background-color: #3b4252;
-                font-size: 12px;
-            }
-        """)
+        game_id_entry.setStyleSheet(_LINEEDIT_QSS)
         self.game_id_entry = game_id_entry
         content_layout.addWidget(self.game_id_label)
         content_layout.addWidget(game_id_entry)
@@ -483,134 +607,137 @@ class ReplayDownloaderApp(QtWidgets.QWidget):
         content_layout.addWidget(self.response_label)
 
         # Styling
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2e3440;
-                color: #d8dee9;
-                font-family: 'Inter', Arial, sans-serif;
-            }
-            QPushButton {
-                padding: 8px;
-                border: 1px solid #4c566a;
-                border-radius: 4px;
-                background-color: #4c566a;
-                color: #d8dee9;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #5e81ac;
-            }
-            QLabel {
-                padding: 4px;
-                font-size: 12px;
-            }
-        """)
+        self.setStyleSheet(_APP_QSS)
 
         main_layout.addLayout(content_layout)
         self.setLayout(main_layout)
 
-        # Resize handles
-        self.resize_handle_br = ResizeHandle(self, 'bottom_right')
-        self.resize_handle_br.move(self.width() - 10, self.height() - 10)
-        self.resize_handle_bl = ResizeHandle(self, 'bottom_left')
-        self.resize_handle_bl.move(0, self.height() - 10)
-        self.resize_handle_tr = ResizeHandle(self, 'top_right')
-        self.resize_handle_tr.move(self.width() - 10, 0)
-        self.resize_handle_tl = ResizeHandle(self, 'top_left')
-        self.resize_handle_tl.move(0, 0)
-
     def mousePressEvent(self, event):
         """Start moving the window if the title bar is clicked."""
         if event.button() == QtCore.Qt.LeftButton and self.title_bar.underMouse():
             self.start_x = event.globalX()
             self.start_y = event.globalY()
+            self.start_pos = self.pos()
             self.is_moving = True
             self.setCursor(QtCore.Qt.ClosedHandCursor)
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         """Move the window based on mouse movement."""
-        if self.is_moving:
-            delta_x = event.globalX() - self.start_x
-            delta_y = event.globalY() - self.start_y
-            self.move(self.x() + delta_x, self.y() + delta_y)
-            self.start_x = event.globalX()
-            self.start_y = event.globalY()
-        super().mouseMoveEvent(event)
+        if not self.is_moving:
+            return
+        pos = event.globalPos()
+        target = QtCore.QPoint(self.start_pos.x() + pos.x() - self.start_x, self.start_pos.y() + pos.y() - self.start_y)
+        # Always replace the queued target: the window only moves when the timer fires.
+        self.pending_pos = target
+        if target != self.pos() and not self.move_timer.isActive():
+            self.move_timer.start()
 
     def mouseReleaseEvent(self, event):
         """Stop moving the window when the mouse is released."""
         if event.button() == QtCore.Qt.LeftButton:
+            self.move_timer.stop()
+            self.apply_pending_move()
             self.is_moving = False
             self.setCursor(QtCore.Qt.ArrowCursor)
         super().mouseReleaseEvent(event)
 
+    def apply_pending_move(self):
+        """Move the window to the most recently queued position."""
+        if self.pending_pos is not None:
+            self.move(self.pending_pos)
+            self.pending_pos = None
+
+    def replay_list_cache_key(self):
+        """Identify the current replay folder state, or None if it cannot be read."""
+        replay_dir = get_replay_directory()
+        try:
+            return (replay_dir, os.stat(replay_dir).st_mtime, frozenset(self.recently_downloaded))
+        except OSError:
+            return None
+
     def list_replays(self):
-        """Display available replays in a dialog."""
-        replay_list, error_message = list_available_replays(self.recently_downloaded)
+        """Display available replays in a dialog, scanning the folder off the UI thread."""
+        cache_key = self.replay_list_cache_key()
+        if cache_key and self._replay_list_cache and self._replay_list_cache[0] == cache_key:
+            self.show_replay_list(*self._replay_list_cache[1])
+            return
+
+        self.list_replays_button.setEnabled(False)
+        self.response_label.setText("Scanning replays...")
+
+        self.list_worker = ReplayListWorker(set(self.recently_downloaded), cache_key)
+        self.start_worker(self.list_worker, self.on_list_finished)
+
+    def on_list_finished(self, replay_list, error_message, cache_key):
+        """Cache the scanned listing and show it."""
+        self._replay_list_cache = (cache_key, (replay_list, error_message)) if cache_key else None
+        self.list_replays_button.setEnabled(True)
+        self.response_label.setText("")
+        self.show_replay_list(replay_list, error_message)
+
+    def show_replay_list(self, replay_list, error_message):
+        """Open the replay dialog, or report why there is nothing to show."""
         if error_message:
             self.response_label.setText(error_message)
             return
         if replay_list:
-            dialog = ReplaysListDialog(replay_list, self.game_id_entry, self)
-            dialog.exec_()
+            if self._replays_dialog is None:
+                self._replays_dialog = ReplaysListDialog(replay_list, self.game_id_entry, self)
+            else:
+                self._replays_dialog.set_replays(replay_list)
+            self._replays_dialog.exec_()
         else:
             self.response_label.setText("No replays available.")
 
-    def download_replay(self):
-        """Start downloading the entered replay."""
+    def start_worker(self, worker, on_finished):
+        """Run a worker on Qt's shared thread pool instead of a new QThread per click."""
+        worker.finished.connect(on_finished)
+        QtCore.QThreadPool.globalInstance().start(WorkerTask(worker))
+
+    def validated_game_id(self):
+        """Return the entered Game ID, or None after reporting why it is invalid."""
         game_id = self.game_id_entry.text().strip()
         if not game_id:
             self.response_label.setText("Please enter a Game ID.")
-            return
+            return None
         if not game_id.isdigit():
             self.response_label.setText("Invalid Game ID. Enter a numeric ID.")
+            return None
+        return game_id
+
+    def download_replay(self):
+        """Start downloading the entered replay."""
+        game_id = self.validated_game_id()
+        if game_id is None:
             return
 
         self.download_button.setEnabled(False)
         self.response_label.setText("Download started...")
 
-        self.thread = QtCore.QThread()
-        self.worker = ReplayDownloaderWorker(game_id)
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.on_download_finished)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.thread.start()
+        self.download_worker = ReplayDownloaderWorker(game_id)
+        self.start_worker(self.download_worker, self.on_download_finished)
 
     def on_download_finished(self, result):
         """Update UI after download completes."""
         if result['success']:
             self.response_label.setText(result['message'])
-            self.recently_downloaded.append(result['game_id'])
+            self.recently_downloaded.add(result['game_id'])
         else:
             self.response_label.setText(result['message'])
         self.download_button.setEnabled(True)
 
     def start_replay_combined(self):
         """Start replay playback via API."""
-        game_id = self.game_id_entry.text().strip()
-        if not game_id:
-            self.response_label.setText("Please enter a Game ID.")
-            return
-        if not game_id.isdigit():
-            self.response_label.setText("Invalid Game ID. Enter a numeric ID.")
+        game_id = self.validated_game_id()
+        if game_id is None:
             return
 
         self.start_replay_button.setEnabled(False)
         self.response_label.setText("Starting replay...")
 
-        self.thread = QtCore.QThread()
-        self.worker = ReplayLauncherWorker(game_id)
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.on_play_combined_finished)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.thread.start()
+        self.launch_worker = ReplayLauncherWorker(game_id)
+        self.start_worker(self.launch_worker, self.on_play_combined_finished)
 
     def on_play_combined_finished(self, result):
         """Update UI after attempting to start replay."""
@@ -619,63 +746,239 @@ class ReplayDownloaderApp(QtWidgets.QWidget):
 
     def show_help_dialog(self):
         """Show the help dialog with useful links."""
-        dialog = HelpDialog(self)
-        dialog.exec_()
+        if self._help_dialog is None:
+            self._help_dialog = HelpDialog(self)
+        self._help_dialog.exec_()
+
+class WorkerTask(QtCore.QRunnable):
+    """Runs a worker's run() on a pooled thread."""
+    def __init__(self, worker):
+        super().__init__()
+        self.worker = worker
+
+    def run(self):
+        self.worker.run()
+
+class ReplayListWorker(QtCore.QObject):
+    """Scans the replay folder in a separate thread."""
+    finished = QtCore.pyqtSignal(object, str, object)
+
+    def __init__(self, recently_downloaded, cache_key):
+        super().__init__()
+        self.recently_downloaded = recently_downloaded
+        self.cache_key = cache_key
+
+    def run(self):
+        replay_list, error_message = list_available_replays(self.recently_downloaded)
+        self.finished.emit(replay_list, error_message or "", self.cache_key)
+
+class ReplayStateWatcher(QtCore.QObject):
+    """Listens on the LCU websocket for a replay's metadata switching to 'watch'."""
+    ready = QtCore.pyqtSignal()
+    subscribed = QtCore.pyqtSignal()
+    failed = QtCore.pyqtSignal()
+
+    def __init__(self, lcu_data, game_id, parent=None):
+        super().__init__(parent)
+        self.uri = f"/lol-replays/v1/metadata/{game_id}"
+        self.closing = False
+
+        ssl_config = QtNetwork.QSslConfiguration.defaultConfiguration()
+        ssl_config.setPeerVerifyMode(QtNetwork.QSslSocket.VerifyNone)
+        self.request = QtNetwork.QNetworkRequest(QtCore.QUrl(f"wss://127.0.0.1:{lcu_data['port']}/"))
+        self.request.setRawHeader(b'Authorization', lcu_data['auth_header'].encode())
+
+        self.socket = QtWebSockets.QWebSocket(parent=self)
+        self.socket.setSslConfiguration(ssl_config)
+        self.socket.connected.connect(self.on_connected)
+        self.socket.textMessageReceived.connect(self.on_message)
+        self.socket.error.connect(self.on_lost)
+        self.socket.disconnected.connect(self.on_lost)
+
+    def open(self):
+        """Start connecting; call after hooking up the signals, since errors can be emitted immediately."""
+        self.socket.open(self.request)
+
+    def on_connected(self):
+        """Subscribe to replay metadata events once the socket is open."""
+        self.socket.sendTextMessage(json.dumps([5, "OnJsonApiEvent_lol-replays_v1_metadata"]))
+        self.subscribed.emit()
+
+    def on_lost(self, *args):
+        """Report once that the socket failed or dropped before we closed it."""
+        if not self.closing:
+            self.closing = True
+            self.failed.emit()
+
+    def on_message(self, message):
+        """Emit ready when this replay's metadata reports the 'watch' state."""
+        try:
+            event = json.loads(message)[2]
+        except (ValueError, IndexError, TypeError):
+            return
+        if not isinstance(event, dict) or event.get('uri') != self.uri:
+            return
+        data = event.get('data') or {}
+        if str(data.get('state', '')).lower() == 'watch':
+            self.ready.emit()
+
+    def close(self):
+        """Close the websocket connection."""
+        self.closing = True
+        self.socket.close()
 
 class ReplayDownloaderWorker(QtCore.QObject):
     """Handles replay downloading in a separate thread."""
     finished = QtCore.pyqtSignal(dict)
+    # Cross-thread hand-offs back to the GUI thread, where polling is timer-driven.
+    _wait_requested = QtCore.pyqtSignal()
+    _metadata_received = QtCore.pyqtSignal(object)
 
     def __init__(self, game_id):
         super().__init__()
         self.game_id = game_id
+        self.lcu_data = None
+        self.watcher = None
+        self.done = False
+        self.polling = False
+        self.in_flight = False
+
+        self.poll_timer = QtCore.QTimer(self)
+        self.poll_timer.setSingleShot(True)
+        self.poll_timer.timeout.connect(self.poll)
+        self.deadline_timer = QtCore.QTimer(self)
+        self.deadline_timer.setSingleShot(True)
+        self.deadline_timer.timeout.connect(self.on_timeout)
+        self._wait_requested.connect(self.start_waiting)
+        self._metadata_received.connect(self.on_poll_metadata)
 
     def run(self):
-        metadata = get_replay_metadata(self.game_id)
+        metadata = get_replay_metadata(self.game_id, prefetch_details=True)
         if metadata is None:
             result = {'success': False, 'message': "Failed to get replay metadata.", 'game_id': self.game_id}
             self.finished.emit(result)
             return
 
         state = metadata.get('state', '').lower()
-        print(f"Initial replay state for game {self.game_id}: {state}")
+        log.debug("Initial replay state for game %s: %s", self.game_id, state)
+
+        handler = self._STATE_HANDLERS.get(state)
+        if handler is None:
+            result = {'success': False, 'message': f"Unknown replay state: {state}", 'game_id': self.game_id}
+        else:
+            result = handler(self)
+        if result is not None:
+            self.finished.emit(result)
 
-        if state == 'download':
-            download_result = download_replay_api(self.game_id)
-            print(f"Download response for Game ID {self.game_id}: {download_result['message']}")
-            if not download_result['success']:
-                self.finished.emit(download_result)
+    def handle_download(self):
+        """Request the download and start waiting for it; returns a result only on failure."""
+        download_result = download_replay_api(self.game_id)
+        log.debug("Download response for Game ID %s: %s", self.game_id, download_result['message'])
+        if not download_result['success']:
+            return download_result
+
+        self.lcu_data = connect_to_lcu()
+        self._wait_requested.emit()
+        return None
+
+    def handle_incompatible(self):
+        """Report that the replay is from a different patch."""
+        return {'success': False, 'message': "Cannot download replay from a different patch.", 'game_id': self.game_id}
+
+    def handle_already_downloaded(self):
+        """Report that the replay is already downloaded."""
+        return {'success': False, 'message': "Replay already downloaded.", 'game_id': self.game_id}
+
+    _STATE_HANDLERS = {
+        'download': handle_download,
+        'incompatible': handle_incompatible,
+        'watch': handle_already_downloaded,
+    }
+
+    def start_waiting(self):
+        """Wait for the replay to reach the 'watch' state without blocking a thread."""
+        self.delay = 0.2
+        self.attempts = 0
+        self.failures = 0
+        if not (QtWebSockets and self.lcu_data and QtNetwork.QSslSocket.supportsSsl()):
+            self.deadline_timer.start(8000)
+            self.start_polling()
+            return
+
+        # The client pushes state changes over its websocket; polling is only the fallback.
+        self.watcher = ReplayStateWatcher(self.lcu_data, self.game_id, self)
+        self.watcher.ready.connect(self.on_ready)
+        self.watcher.subscribed.connect(self.poll)  # catch a download that finished before subscribing
+        self.watcher.failed.connect(self.start_polling)
+        self.deadline_timer.start(15000)
+        self.watcher.open()
+
+    def start_polling(self):
+        """Fall back to polling the metadata with exponential backoff."""
+        if self.polling or self.done:
+            return
+        self.polling = True
+        if not self.in_flight:
+            self.schedule_poll()
+
+    def schedule_poll(self):
+        """Queue the next metadata check after the current backoff delay."""
+        # Poll quickly at first so fast downloads finish promptly, then back off.
+        pause = self.delay + random.uniform(0, 0.05)
+        self.delay = min(self.delay * 1.5, 1.0)
+        self.poll_timer.start(int(pause * 1000))
+
+    def poll(self):
+        """Fetch the replay metadata on the LCU pool; the result is handled on the GUI thread."""
+        if self.done or self.in_flight:
+            return
+        self.in_flight = True
+        self.attempts += 1
+        future = _LCU_POOL.submit(get_replay_metadata, self.game_id)
+        future.add_done_callback(lambda f: self._metadata_received.emit(None if f.exception() else f.result()))
+
+    def on_poll_metadata(self, metadata):
+        """Finish on 'watch'; while polling, check again until the deadline timer fires."""
+        self.in_flight = False
+        if self.done:
+            return
+        if metadata is not None:
+            current_state = metadata.get('state', '').lower()
+            log.debug("Replay state for game %s: %s", self.game_id, current_state)
+            if current_state == 'watch':
+                self.on_ready()
                 return
+        if not self.polling:
+            return
 
-            max_attempts = 8
-            attempts = 0
-            while attempts < max_attempts:
-                time.sleep(1)
-                metadata = get_replay_metadata(self.game_id)
-                if metadata:
-                    current_state = metadata.get('state', '').lower()
-                    print(f"Replay state for game {self.game_id}: {current_state}")
-                    if current_state == 'watch':
-                        success_result = {'success': True, 'message': f"Replay {self.game_id} downloaded successfully.", 'game_id': self.game_id}
-                        self.finished.emit(success_result)
-                        return
-                attempts += 1
-                print(f"Attempt {attempts}/{max_attempts} to check replay status.")
-
-            timeout_result = {'success': False, 'message': f"Download timed out for Replay {self.game_id}.", 'game_id': self.game_id}
-            self.finished.emit(timeout_result)
-        elif state == 'incompatible':
-            message = "Cannot download replay from a different patch."
-            result = {'success': False, 'message': message, 'game_id': self.game_id}
-            self.finished.emit(result)
-        elif state == 'watch':
-            message = "Replay already downloaded."
-            result = {'success': False, 'message': message, 'game_id': self.game_id}
-            self.finished.emit(result)
+        if metadata is None:
+            self.failures += 1
+            if self.failures >= 3:
+                self.finish({'success': False, 'message': f"Lost contact with LeagueClient while downloading Replay {self.game_id}.", 'game_id': self.game_id})
+                return
         else:
-            message = f"Unknown replay state: {state}"
-            result = {'success': False, 'message': message, 'game_id': self.game_id}
-            self.finished.emit(result)
+            self.failures = 0
+            log.debug("Attempt %d to check replay status.", self.attempts)
+        self.schedule_poll()
+
+    def on_timeout(self):
+        """Give up once the wait deadline passes."""
+        self.finish({'success': False, 'message': f"Download timed out for Replay {self.game_id}.", 'game_id': self.game_id})
+
+    def on_ready(self):
+        """Report a successful download."""
+        self.finish({'success': True, 'message': f"Replay {self.game_id} downloaded successfully.", 'game_id': self.game_id})
+
+    def finish(self, result):
+        """Stop waiting, close the watcher and emit the result once."""
+        if self.done:
+            return
+        self.done = True
+        self.poll_timer.stop()
+        self.deadline_timer.stop()
+        if self.watcher:
+            self.watcher.close()
+        self.finished.emit(result)
 
 class ReplayLauncherWorker(QtCore.QObject):
     """Handles replay launching in a separate thread."""
@@ -686,26 +989,39 @@ class ReplayLauncherWorker(QtCore.QObject):
         self.game_id = game_id
 
     def run(self):
-        metadata = get_replay_metadata(self.game_id)
+        lcu_data = connect_to_lcu()
+        if not lcu_data:
+            self.finished.emit("LeagueClient not found. Ensure it's running and try again.")
+            return
+
+        metadata = get_replay_metadata(self.game_id, lcu_data=lcu_data)
         if metadata is None:
             self.finished.emit("Failed to get replay metadata.")
             return
 
         state = metadata.get('state', '').lower()
-        print(f"Replay state for game {self.game_id}: {state}")
+        log.debug("Replay state for game %s: %s", self.game_id, state)
 
-        if state == 'watch':
-            result = play_replay_api(self.game_id)
-            self.finished.emit(result)
-        elif state == 'incompatible':
-            message = "Cannot play replay from a different patch."
-            self.finished.emit(message)
-        elif state == 'download':
-            message = "Download the replay first."
-            self.finished.emit(message)
-        else:
-            message = f"Unknown replay state: {state}"
-            self.finished.emit(message)
+        handler = self._STATE_HANDLERS.get(state)
+        self.finished.emit(handler(self, lcu_data) if handler else f"Unknown replay state: {state}")
+
+    def handle_watch(self, lcu_data):
+        """Launch the downloaded replay."""
+        return play_replay_api(self.game_id, lcu_data)
+
+    def handle_incompatible(self, lcu_data):
+        """Report that the replay is from a different patch."""
+        return "Cannot play replay from a different patch."
+
+    def handle_download(self, lcu_data):
+        """Report that the replay must be downloaded first."""
+        return "Download the replay first."
+
+    _STATE_HANDLERS = {
+        'watch': handle_watch,
+        'incompatible': handle_incompatible,
+        'download': handle_download,
+    }
 
 def main():
     """Start the application."""